@@ -6,7 +6,8 @@
 #     "rich",
 #     "platformdirs",
 #     "readchar",
-#     "httpx",
+#     "httpx[http2,brotli]",
+#     "orjson",
 # ]
 # ///
 """
@@ -32,32 +33,75 @@ import tempfile
 import shutil
 import shlex
 import json
+import functools
+import atexit
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple
 
+import orjson
 import typer
-import httpx
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
-from rich.live import Live
 from rich.align import Align
-from rich.table import Table
-from rich.tree import Tree
 from typer.core import TyperGroup
-
-# For cross-platform keyboard input
-import readchar
-import ssl
-import truststore
 from datetime import datetime, timezone
 
-ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-client = httpx.Client(verify=ssl_context)
+if TYPE_CHECKING:
+    import ssl
+    from concurrent.futures import Future
+
+    import httpx
+
+# Network, TLS and keyboard libraries are imported on first use so that
+# `--help`, the banner and other offline commands don't pay for them.
 
+@functools.cache
+def _tls_verify() -> "ssl.SSLContext | bool":
+    """Return the TLS verification setting for the shared client.
+
+    By default certificates are checked against the OS trust store via
+    truststore, which corporate proxies usually require. Setting
+    FORGELOOP_SYSTEM_CERTS=0 uses httpx's bundled CA certificates instead and
+    skips loading the system store (useful on CI runners).
+    """
+    if os.getenv("FORGELOOP_SYSTEM_CERTS", "").strip().lower() in ("0", "false", "no", "off"):
+        return True
+    import ssl
+    import truststore
+    return truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+def _new_client(verify: "ssl.SSLContext | bool") -> "httpx.Client":
+    """Create a pooled, HTTP/2-capable client with the given TLS verification setting.
+
+    Connections are kept alive so the release lookup and the template download
+    reuse one TLS session instead of handshaking per request.
+    """
+    import httpx
+    return httpx.Client(
+        verify=verify,
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+        timeout=httpx.Timeout(connect=10.0, read=30.0, write=10.0, pool=5.0),
+        headers={"User-Agent": "forgeloop-cli"},
+    )
+
+@functools.cache
+def get_client() -> "httpx.Client":
+    """Return the shared HTTP client, created on first use and closed at exit."""
+    client = _new_client(_tls_verify())
+    atexit.register(client.close)
+    return client
+
+@functools.lru_cache(maxsize=4)
 def _github_token(cli_token: str | None = None) -> str | None:
-    """Return sanitized GitHub token (cli arg takes precedence) or None."""
+    """Return sanitized GitHub token (cli arg takes precedence) or None.
+
+    Cached per `cli_token`: the environment is read once per process.
+    """
     return ((cli_token or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN") or "").strip()) or None
 
 def _github_auth_headers(cli_token: str | None = None) -> dict:
@@ -65,26 +109,136 @@ def _github_auth_headers(cli_token: str | None = None) -> dict:
     token = _github_token(cli_token)
     return {"Authorization": f"Bearer {token}"} if token else {}
 
-def _parse_rate_limit_headers(headers: httpx.Headers) -> dict:
+# Sent with GitHub REST API calls (not asset downloads). Accept-Encoding is left
+# to httpx, which advertises gzip/deflate and br when brotli is installed.
+_GITHUB_API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+
+def _github_api_headers(cli_token: str | None = None) -> dict:
+    """Return headers for a GitHub REST API request, including auth if available."""
+    return {**_GITHUB_API_HEADERS, **_github_auth_headers(cli_token)}
+
+def _http_cache_path(url: str) -> Path:
+    """Return the on-disk cache file for a GET of `url`."""
+    import hashlib
+    from platformdirs import user_cache_dir
+
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return Path(user_cache_dir("forgeloop")) / "http" / f"{digest}.json"
+
+def _cache_max_age(cache_control: str) -> int:
+    """Return the max-age (seconds) allowed by a Cache-Control header, or 0."""
+    max_age = 0
+    for directive in cache_control.lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name in ("no-cache", "no-store"):
+            return 0
+        if name == "max-age":
+            try:
+                max_age = int(value.strip('"'))
+            except ValueError:
+                return 0
+    return max_age
+
+def _valid_http_cache_entry(entry) -> bool:
+    """Return True if a loaded cache entry has the expected field types."""
+    if not isinstance(entry, dict) or not isinstance(entry.get("body"), str):
+        return False
+    if not isinstance(entry.get("etag"), str):
+        return False
+    return all(
+        isinstance(entry.get(field), (int, float)) and not isinstance(entry.get(field), bool)
+        for field in ("fetched_at", "max_age")
+    )
+
+def _cached_get(client: "httpx.Client", url: str, *, timeout: float, headers: dict | None = None) -> "httpx.Response":
+    """GET `url`, reusing a cached response body validated by its ETag.
+
+    Within the Cache-Control max-age of the last response no request is made at
+    all. After that the request carries If-None-Match and a 304 is answered from
+    the cache, saving the body transfer. GitHub only exempts such 304s from the
+    rate limit for authenticated requests; unauthenticated ones still count.
+    Cache read/write failures are ignored; the network response is used instead.
+    """
+    import httpx
+
+    cache_path = _http_cache_path(url)
+    try:
+        entry = orjson.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        entry = None
+    if not _valid_http_cache_entry(entry):
+        entry = None
+
+    now = time.time()
+    if entry and now - entry["fetched_at"] < entry["max_age"]:
+        return httpx.Response(200, text=entry["body"], request=httpx.Request("GET", url))
+
+    request_headers = dict(headers or {})
+    if entry and entry["etag"]:
+        request_headers["If-None-Match"] = entry["etag"]
+
+    response = client.get(url, timeout=timeout, follow_redirects=True, headers=request_headers)
+    max_age = _cache_max_age(response.headers.get("Cache-Control", ""))
+
+    if response.status_code == 304 and entry:
+        entry.update(fetched_at=now, max_age=max_age)
+        _write_http_cache(cache_path, entry)
+        return httpx.Response(200, text=entry["body"], request=response.request)
+
+    if response.status_code == 200 and response.headers.get("ETag"):
+        _write_http_cache(cache_path, {
+            "etag": response.headers["ETag"],
+            "body": response.text,
+            "fetched_at": now,
+            "max_age": max_age,
+        })
+    return response
+
+def _write_http_cache(cache_path: Path, entry: dict) -> None:
+    """Atomically write a cache entry, ignoring filesystem errors."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(entry))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+@functools.cache
+def _local_timezone() -> timezone:
+    """Return the local UTC offset, resolved once per process.
+
+    The CLI is short-lived, so a fixed offset is accurate for the reset times
+    it reports and avoids re-resolving the platform zone on every conversion.
+    """
+    return datetime.now().astimezone().tzinfo
+
+def _parse_rate_limit_headers(headers: "httpx.Headers") -> dict:
     """Extract and parse GitHub rate-limit headers."""
     info = {}
     
     # Standard GitHub rate-limit headers
-    if "X-RateLimit-Limit" in headers:
-        info["limit"] = headers.get("X-RateLimit-Limit")
-    if "X-RateLimit-Remaining" in headers:
-        info["remaining"] = headers.get("X-RateLimit-Remaining")
-    if "X-RateLimit-Reset" in headers:
-        reset_epoch = int(headers.get("X-RateLimit-Reset", "0"))
+    limit = headers.get("X-RateLimit-Limit")
+    if limit is not None:
+        info["limit"] = limit
+    remaining = headers.get("X-RateLimit-Remaining")
+    if remaining is not None:
+        info["remaining"] = remaining
+    reset_header = headers.get("X-RateLimit-Reset")
+    if reset_header is not None:
+        reset_epoch = int(reset_header)
         if reset_epoch:
             reset_time = datetime.fromtimestamp(reset_epoch, tz=timezone.utc)
             info["reset_epoch"] = reset_epoch
             info["reset_time"] = reset_time
-            info["reset_local"] = reset_time.astimezone()
+            info["reset_local"] = reset_time.astimezone(_local_timezone())
     
     # Retry-After header (seconds or HTTP-date)
-    if "Retry-After" in headers:
-        retry_after = headers.get("Retry-After")
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
         try:
             info["retry_after_seconds"] = int(retry_after)
         except ValueError:
@@ -93,12 +247,19 @@ def _parse_rate_limit_headers(headers: httpx.Headers) -> dict:
     
     return info
 
-def _format_rate_limit_error(status_code: int, headers: httpx.Headers, url: str) -> str:
+# Troubleshooting guidance appended to every rate-limit error message
+_RATE_LIMIT_TIPS = """\
+[bold]Troubleshooting Tips:[/bold]
+  • If you're on a shared CI or corporate environment, you may be rate-limited.
+  • Consider using a GitHub token via --github-token or the GH_TOKEN/GITHUB_TOKEN
+    environment variable to increase rate limits.
+  • Authenticated requests have a limit of 5,000/hour vs 60/hour for unauthenticated."""
+
+def _format_rate_limit_error(status_code: int, headers: "httpx.Headers", url: str) -> str:
     """Format a user-friendly error message with rate-limit information."""
     rate_info = _parse_rate_limit_headers(headers)
     
-    lines = [f"GitHub API returned status {status_code} for {url}"]
-    lines.append("")
+    lines = [f"GitHub API returned status {status_code} for {url}", ""]
     
     if rate_info:
         lines.append("[bold]Rate Limit Information:[/bold]")
@@ -113,108 +274,114 @@ def _format_rate_limit_error(status_code: int, headers: httpx.Headers, url: str)
             lines.append(f"  • Retry after: {rate_info['retry_after_seconds']} seconds")
         lines.append("")
     
-    # Add troubleshooting guidance
-    lines.append("[bold]Troubleshooting Tips:[/bold]")
-    lines.append("  • If you're on a shared CI or corporate environment, you may be rate-limited.")
-    lines.append("  • Consider using a GitHub token via --github-token or the GH_TOKEN/GITHUB_TOKEN")
-    lines.append("    environment variable to increase rate limits.")
-    lines.append("  • Authenticated requests have a limit of 5,000/hour vs 60/hour for unauthenticated.")
-    
+    lines.append(_RATE_LIMIT_TIPS)
     return "\n".join(lines)
 
-# Agent configuration with name, folder, install URL, and CLI tool requirement
-AGENT_CONFIG = {
-    "copilot": {
-        "name": "GitHub Copilot",
-        "folder": ".github/",
-        "install_url": None,  # IDE-based, no CLI check needed
-        "requires_cli": False,
-    },
-    "claude": {
-        "name": "Claude Code",
-        "folder": ".claude/",
-        "install_url": "https://docs.anthropic.com/en/docs/claude-code/setup",
-        "requires_cli": True,
-    },
-    "gemini": {
-        "name": "Gemini CLI",
-        "folder": ".gemini/",
-        "install_url": "https://github.com/google-gemini/gemini-cli",
-        "requires_cli": True,
-    },
-    "cursor-agent": {
-        "name": "Cursor",
-        "folder": ".cursor/",
-        "install_url": None,  # IDE-based
-        "requires_cli": False,
-    },
-    "qwen": {
-        "name": "Qwen Code",
-        "folder": ".qwen/",
-        "install_url": "https://github.com/QwenLM/qwen-code",
-        "requires_cli": True,
-    },
-    "opencode": {
-        "name": "opencode",
-        "folder": ".opencode/",
-        "install_url": "https://opencode.ai",
-        "requires_cli": True,
-    },
-    "codex": {
-        "name": "Codex CLI",
-        "folder": ".codex/",
-        "install_url": "https://github.com/openai/codex",
-        "requires_cli": True,
-    },
-    "windsurf": {
-        "name": "Windsurf",
-        "folder": ".windsurf/",
-        "install_url": None,  # IDE-based
-        "requires_cli": False,
-    },
-    "kilocode": {
-        "name": "Kilo Code",
-        "folder": ".kilocode/",
-        "install_url": None,  # IDE-based
-        "requires_cli": False,
-    },
-    "auggie": {
-        "name": "Auggie CLI",
-        "folder": ".augment/",
-        "install_url": "https://docs.augmentcode.com/cli/setup-auggie/install-auggie-cli",
-        "requires_cli": True,
-    },
-    "codebuddy": {
-        "name": "CodeBuddy",
-        "folder": ".codebuddy/",
-        "install_url": "https://www.codebuddy.ai/cli",
-        "requires_cli": True,
-    },
-    "roo": {
-        "name": "Roo Code",
-        "folder": ".roo/",
-        "install_url": None,  # IDE-based
-        "requires_cli": False,
-    },
-    "q": {
-        "name": "Amazon Q Developer CLI",
-        "folder": ".amazonq/",
-        "install_url": "https://aws.amazon.com/developer/learning/q-developer-cli/",
-        "requires_cli": True,
-    },
-    "amp": {
-        "name": "Amp",
-        "folder": ".agents/",
-        "install_url": "https://ampcode.com/manual#install",
-        "requires_cli": True,
-    },
-    "shai": {
-        "name": "SHAI",
-        "folder": ".shai/",
-        "install_url": "https://github.com/ovh/shai",
-        "requires_cli": True,
-    },
-}
+class AgentConfig(NamedTuple):
+    """Static metadata for a supported AI agent."""
+    name: str
+    folder: str
+    install_url: str | None
+    requires_cli: bool
+
+# Agent configuration with name, folder, install URL, and CLI tool requirement.
+# Keys are the agents' actual executable names; the mapping is read-only.
+AGENT_CONFIG = MappingProxyType({
+    "copilot": AgentConfig(
+        name="GitHub Copilot",
+        folder=".github/",
+        install_url=None,  # IDE-based, no CLI check needed
+        requires_cli=False,
+    ),
+    "claude": AgentConfig(
+        name="Claude Code",
+        folder=".claude/",
+        install_url="https://docs.anthropic.com/en/docs/claude-code/setup",
+        requires_cli=True,
+    ),
+    "gemini": AgentConfig(
+        name="Gemini CLI",
+        folder=".gemini/",
+        install_url="https://github.com/google-gemini/gemini-cli",
+        requires_cli=True,
+    ),
+    "cursor-agent": AgentConfig(
+        name="Cursor",
+        folder=".cursor/",
+        install_url=None,  # IDE-based
+        requires_cli=False,
+    ),
+    "qwen": AgentConfig(
+        name="Qwen Code",
+        folder=".qwen/",
+        install_url="https://github.com/QwenLM/qwen-code",
+        requires_cli=True,
+    ),
+    "opencode": AgentConfig(
+        name="opencode",
+        folder=".opencode/",
+        install_url="https://opencode.ai",
+        requires_cli=True,
+    ),
+    "codex": AgentConfig(
+        name="Codex CLI",
+        folder=".codex/",
+        install_url="https://github.com/openai/codex",
+        requires_cli=True,
+    ),
+    "windsurf": AgentConfig(
+        name="Windsurf",
+        folder=".windsurf/",
+        install_url=None,  # IDE-based
+        requires_cli=False,
+    ),
+    "kilocode": AgentConfig(
+        name="Kilo Code",
+        folder=".kilocode/",
+        install_url=None,  # IDE-based
+        requires_cli=False,
+    ),
+    "auggie": AgentConfig(
+        name="Auggie CLI",
+        folder=".augment/",
+        install_url="https://docs.augmentcode.com/cli/setup-auggie/install-auggie-cli",
+        requires_cli=True,
+    ),
+    "codebuddy": AgentConfig(
+        name="CodeBuddy",
+        folder=".codebuddy/",
+        install_url="https://www.codebuddy.ai/cli",
+        requires_cli=True,
+    ),
+    "roo": AgentConfig(
+        name="Roo Code",
+        folder=".roo/",
+        install_url=None,  # IDE-based
+        requires_cli=False,
+    ),
+    "q": AgentConfig(
+        name="Amazon Q Developer CLI",
+        folder=".amazonq/",
+        install_url="https://aws.amazon.com/developer/learning/q-developer-cli/",
+        requires_cli=True,
+    ),
+    "amp": AgentConfig(
+        name="Amp",
+        folder=".agents/",
+        install_url="https://ampcode.com/manual#install",
+        requires_cli=True,
+    ),
+    "shai": AgentConfig(
+        name="SHAI",
+        folder=".shai/",
+        install_url="https://github.com/ovh/shai",
+        requires_cli=True,
+    ),
+})
+
+# Valid --ai values, and the subset whose CLI must be present on PATH
+AGENT_KEYS = frozenset(AGENT_CONFIG)
+CLI_AGENT_KEYS = frozenset(key for key, config in AGENT_CONFIG.items() if config.requires_cli)
 
 SCRIPT_TYPE_CHOICES = {"sh": "POSIX Shell (bash/zsh)", "ps": "PowerShell"}
 
@@ -230,6 +397,19 @@ BANNER = """
 """
 
 TAGLINE = "ForgeLoop – Spec-Driven Development Toolkit"
+
+# Markup for the status marker shown in front of each StepTracker line
+STATUS_SYMBOLS = {
+    "done": "[green]●[/green]",
+    "pending": "[green dim]○[/green dim]",
+    "running": "[cyan]○[/cyan]",
+    "error": "[red]●[/red]",
+    "skipped": "[yellow]○[/yellow]",
+}
+# Parsed once so StepTracker.render() doesn't re-tokenize markup on every refresh
+_STATUS_SYMBOL_TEXT = {status: Text.from_markup(markup) for status, markup in STATUS_SYMBOLS.items()}
+_NO_SYMBOL_TEXT = Text(" ")
+
 class StepTracker:
     """Track and render hierarchical steps without emojis, similar to Claude Code tree output.
     Supports live auto-refresh via an attached refresh callback.
@@ -237,15 +417,19 @@ class StepTracker:
     def __init__(self, title: str):
         self.title = title
         self.steps = []  # list of dicts: {key, label, status, detail}
+        self._index: dict[str, int] = {}  # step key -> position in self.steps
         self.status_order = {"pending": 0, "running": 1, "done": 2, "error": 3, "skipped": 4}
         self._refresh_cb = None  # callable to trigger UI refresh
+        self._last_refresh = 0.0
+        self._min_refresh_interval = 1 / 20  # seconds; caps refreshes at ~20 Hz
+        self._refresh_timer = None  # pending trailing-edge refresh, if any
 
     def attach_refresh(self, cb):
         self._refresh_cb = cb
 
     def add(self, key: str, label: str):
-        if key not in [s["key"] for s in self.steps]:
-            self.steps.append({"key": key, "label": label, "status": "pending", "detail": ""})
+        if key not in self._index:
+            self._append(key, label, "pending", "")
             self._maybe_refresh()
 
     def start(self, key: str, detail: str = ""):
@@ -260,63 +444,75 @@ class StepTracker:
     def skip(self, key: str, detail: str = ""):
         self._update(key, status="skipped", detail=detail)
 
+    def _append(self, key: str, label: str, status: str, detail: str):
+        self._index[key] = len(self.steps)
+        self.steps.append({"key": key, "label": label, "status": status, "detail": detail})
+
     def _update(self, key: str, status: str, detail: str):
-        for s in self.steps:
-            if s["key"] == key:
-                s["status"] = status
-                if detail:
-                    s["detail"] = detail
-                self._maybe_refresh()
-                return
-
-        self.steps.append({"key": key, "label": key, "status": status, "detail": detail})
-        self._maybe_refresh()
-
-    def _maybe_refresh(self):
-        if self._refresh_cb:
-            try:
-                self._refresh_cb()
-            except Exception:
-                pass
+        i = self._index.get(key)
+        if i is None:
+            self._append(key, key, status, detail)
+        else:
+            s = self.steps[i]
+            s["status"] = status
+            if detail:
+                s["detail"] = detail
+        # Always show a step reaching a final state; intermediate updates may be coalesced
+        self._maybe_refresh(force=status in ("done", "error", "skipped"))
+
+    def _maybe_refresh(self, force: bool = False):
+        if not self._refresh_cb:
+            return
+        wait = self._last_refresh + self._min_refresh_interval - time.monotonic()
+        if not force and wait > 0:
+            # Coalesce the burst, but draw its final state once the interval
+            # has passed so a skipped update is never lost.
+            if self._refresh_timer is None:
+                self._refresh_timer = threading.Timer(wait, self._flush_refresh)
+                self._refresh_timer.daemon = True
+                self._refresh_timer.start()
+            return
+        self._refresh()
+
+    def _flush_refresh(self):
+        self._refresh_timer = None
+        self._refresh()
+
+    def _refresh(self):
+        self._last_refresh = time.monotonic()
+        try:
+            self._refresh_cb()
+        except Exception:
+            pass
 
     def render(self):
-        tree = Tree(f"[cyan]{self.title}[/cyan]", guide_style="grey50")
+        from rich.tree import Tree
+
+        tree = Tree(Text(self.title, style="cyan"), guide_style="grey50")
         for step in self.steps:
             label = step["label"]
             detail_text = step["detail"].strip() if step["detail"] else ""
 
             status = step["status"]
-            if status == "done":
-                symbol = "[green]●[/green]"
-            elif status == "pending":
-                symbol = "[green dim]○[/green dim]"
-            elif status == "running":
-                symbol = "[cyan]○[/cyan]"
-            elif status == "error":
-                symbol = "[red]●[/red]"
-            elif status == "skipped":
-                symbol = "[yellow]○[/yellow]"
-            else:
-                symbol = " "
+            symbol = _STATUS_SYMBOL_TEXT.get(status, _NO_SYMBOL_TEXT)
 
             if status == "pending":
                 # Entire line light gray (pending)
-                if detail_text:
-                    line = f"{symbol} [bright_black]{label} ({detail_text})[/bright_black]"
-                else:
-                    line = f"{symbol} [bright_black]{label}[/bright_black]"
+                body = f"{label} ({detail_text})" if detail_text else label
+                line = Text.assemble(symbol, " ", (body, "bright_black"))
             else:
                 # Label white, detail (if any) light gray in parentheses
+                line = Text.assemble(symbol, " ", (label, "white"))
                 if detail_text:
-                    line = f"{symbol} [white]{label}[/white] [bright_black]({detail_text})[/bright_black]"
-                else:
-                    line = f"{symbol} [white]{label}[/white]"
+                    line.append(f" ({detail_text})", style="bright_black")
 
             tree.add(line)
         return tree
 
 def get_key():
     """Get a single keypress in a cross-platform way using readchar."""
+    import readchar
+
     key = readchar.readkey()
 
     if key == readchar.key.UP or key == readchar.key.CTRL_P:
@@ -347,6 +543,9 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
     Returns:
         Selected option key
     """
+    from rich.live import Live
+    from rich.table import Table
+
     option_keys = list(options.keys())
     if default_key and default_key in option_keys:
         selected_index = option_keys.index(default_key)
@@ -429,8 +628,9 @@ app = typer.Typer(
     cls=BannerGroup,
 )
 
-def show_banner():
-    """Display the ASCII art banner."""
+@functools.cache
+def _banner_renderables() -> tuple[Align, Align]:
+    """Build the styled banner and tagline once; both are reused on every display."""
     banner_lines = BANNER.strip().split('\n')
     colors = ["bright_blue", "blue", "cyan", "bright_cyan", "white", "bright_white"]
 
@@ -439,8 +639,13 @@ def show_banner():
         color = colors[i % len(colors)]
         styled_banner.append(line + "\n", style=color)
 
-    console.print(Align.center(styled_banner))
-    console.print(Align.center(Text(TAGLINE, style="italic bright_yellow")))
+    return Align.center(styled_banner), Align.center(Text(TAGLINE, style="italic bright_yellow"))
+
+def show_banner():
+    """Display the ASCII art banner."""
+    banner, tagline = _banner_renderables()
+    console.print(banner)
+    console.print(tagline)
     console.print()
 
 @app.callback()
@@ -469,28 +674,44 @@ def run_command(cmd: list[str], check_return: bool = True, capture: bool = False
             raise
         return None
 
-def check_tool(tool: str, tracker: StepTracker = None) -> bool:
+def _tool_available(tool: str) -> bool:
+    """Return True if `tool` can be found on this machine (no UI side effects)."""
+    # Special handling for Claude CLI after `claude migrate-installer`
+    # See: https://github.com/github/spec-kit/issues/123
+    # The migrate-installer command REMOVES the original executable from PATH
+    # and creates an alias at ~/.claude/local/claude instead
+    # This path should be prioritized over other claude executables in PATH
+    if tool == "claude" and CLAUDE_LOCAL_PATH.is_file():
+        return True
+    return shutil.which(tool) is not None
+
+def check_tools(tools: list[str]) -> dict[str, bool]:
+    """Look up several tools concurrently.
+
+    Each lookup walks PATH (and PATHEXT on Windows), so running them on a small
+    thread pool keeps `check` from paying for every directory scan serially.
+
+    Returns:
+        Mapping of tool name to availability, in the order given
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(tools) or 1)) as pool:
+        return dict(zip(tools, pool.map(_tool_available, tools)))
+
+def check_tool(tool: str, tracker: StepTracker = None, *, found: bool | None = None) -> bool:
     """Check if a tool is installed. Optionally update tracker.
     
     Args:
         tool: Name of the tool to check
         tracker: Optional StepTracker to update with results
+        found: Pre-computed availability (e.g. from `check_tools`); looked up if omitted
         
     Returns:
         True if tool is found, False otherwise
     """
-    # Special handling for Claude CLI after `claude migrate-installer`
-    # See: https://github.com/github/spec-kit/issues/123
-    # The migrate-installer command REMOVES the original executable from PATH
-    # and creates an alias at ~/.claude/local/claude instead
-    # This path should be prioritized over other claude executables in PATH
-    if tool == "claude":
-        if CLAUDE_LOCAL_PATH.exists() and CLAUDE_LOCAL_PATH.is_file():
-            if tracker:
-                tracker.complete(tool, "available")
-            return True
-    
-    found = shutil.which(tool) is not None
+    if found is None:
+        found = _tool_available(tool)
     
     if tracker:
         if found:
@@ -500,6 +721,24 @@ def check_tool(tool: str, tracker: StepTracker = None) -> bool:
     
     return found
 
+def _require_agent_cli(agent_key: str) -> None:
+    """Exit with an error panel if `agent_key` needs a CLI that isn't installed."""
+    agent_config = AGENT_CONFIG.get(agent_key)
+    if not agent_config or not agent_config.requires_cli or check_tool(agent_key):
+        return
+    error_panel = Panel(
+        f"[cyan]{agent_key}[/cyan] not found\n"
+        f"Install from: [cyan]{agent_config.install_url}[/cyan]\n"
+        f"{agent_config.name} is required to continue with this project type.\n\n"
+        "Tip: Use [cyan]--ignore-agent-tools[/cyan] to skip this check",
+        title="[red]Agent Detection Error[/red]",
+        border_style="red",
+        padding=(1, 2)
+    )
+    console.print()
+    console.print(error_panel)
+    raise typer.Exit(1)
+
 def is_git_repo(path: Path = None) -> bool:
     """Check if the specified path is inside a git repository."""
     if path is None:
@@ -531,13 +770,17 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Option
         Tuple of (success: bool, error_message: Optional[str])
     """
     try:
-        original_cwd = Path.cwd()
-        os.chdir(project_path)
         if not quiet:
             console.print("[cyan]Initializing git repository...[/cyan]")
-        subprocess.run(["git", "init"], check=True, capture_output=True, text=True)
-        subprocess.run(["git", "add", "."], check=True, capture_output=True, text=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit from ForgeLoop template"], check=True, capture_output=True, text=True)
+        # Each step depends on the previous one, so they run in sequence. Passing
+        # cwd= instead of os.chdir() keeps the process working directory intact
+        # for any other threads (e.g. the release prefetch in `init`).
+        for cmd in (
+            ["git", "init"],
+            ["git", "add", "."],
+            ["git", "commit", "-m", "Initial commit from ForgeLoop template"],
+        ):
+            subprocess.run(cmd, check=True, capture_output=True, text=True, cwd=project_path)
         if not quiet:
             console.print("[green]✓[/green] Git repository initialized")
         return True, None
@@ -552,8 +795,6 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Option
         if not quiet:
             console.print(f"[red]Error initializing git repository:[/red] {e}")
         return False, error_msg
-    finally:
-        os.chdir(original_cwd)
 
 def handle_vscode_settings(sub_item, dest_file, rel_path, verbose=False, tracker=None) -> None:
     """Handle merging or copying of .vscode/settings.json files."""
@@ -622,34 +863,73 @@ def merge_json_files(existing_path: Path, new_content: dict, verbose: bool = Fal
 
     return merged
 
-def download_template_from_github(ai_assistant: str, download_dir: Path, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: httpx.Client = None, debug: bool = False, github_token: str = None) -> Tuple[Path, dict]:
+def fetch_latest_release(client: "httpx.Client | None" = None, *, debug: bool = False, github_token: str = None) -> dict:
+    """Fetch metadata for the latest template release.
+
+    Raises RuntimeError with a user-facing message if the request fails.
+    """
     repo_owner = "soft-wa-re"
     repo_name = "forge-loop"
     if client is None:
-        client = httpx.Client(verify=ssl_context)
+        client = get_client()
+
+    api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
+    response = _cached_get(client, api_url, timeout=30, headers=_github_api_headers(github_token))
+    status = response.status_code
+    if status != 200:
+        # Format detailed error message with rate-limit info
+        error_msg = _format_rate_limit_error(status, response.headers, api_url)
+        if debug:
+            error_msg += f"\n\n[dim]Response body (truncated 500):[/dim]\n{response.text[:500]}"
+        raise RuntimeError(error_msg)
+    try:
+        return orjson.loads(response.content)
+    except ValueError as je:
+        raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
+
+def _prefetch_release(client: "httpx.Client", **kwargs) -> "Future[dict]":
+    """Run `fetch_latest_release` on a daemon thread and return its Future.
+
+    A daemon thread is used (rather than an executor, whose workers are joined
+    at interpreter exit) so an abandoned lookup never delays the CLI exiting.
+    """
+    from concurrent.futures import Future
+
+    future: "Future[dict]" = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fetch_latest_release(client, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="forgeloop-release-prefetch", daemon=True).start()
+    return future
+
+def download_template_from_github(ai_assistant: str, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: "httpx.Client | None" = None, debug: bool = False, github_token: str = None, release: "Future[dict] | None" = None) -> Tuple[tempfile.SpooledTemporaryFile, dict]:
+    """Download the template archive for the given assistant and script type.
+
+    The archive is streamed into a SpooledTemporaryFile, which is returned
+    rewound to the start; the caller is responsible for closing it.
+
+    If `release` is given it should resolve to the output of `fetch_latest_release`
+    (e.g. a lookup started earlier in the background); otherwise it is fetched here.
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    if client is None:
+        client = get_client()
 
     if verbose:
         console.print("[cyan]Fetching latest release information...[/cyan]")
-    api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
 
     try:
-        response = client.get(
-            api_url,
-            timeout=30,
-            follow_redirects=True,
-            headers=_github_auth_headers(github_token),
-        )
-        status = response.status_code
-        if status != 200:
-            # Format detailed error message with rate-limit info
-            error_msg = _format_rate_limit_error(status, response.headers, api_url)
-            if debug:
-                error_msg += f"\n\n[dim]Response body (truncated 500):[/dim]\n{response.text[:500]}"
-            raise RuntimeError(error_msg)
-        try:
-            release_data = response.json()
-        except ValueError as je:
-            raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
+        if release is not None:
+            release_data = release.result()
+        else:
+            release_data = fetch_latest_release(client, debug=debug, github_token=github_token)
     except Exception as e:
         console.print(f"[red]Error fetching release information[/red]")
         console.print(Panel(str(e), title="Fetch Error", border_style="red"))
@@ -679,10 +959,11 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, scri
         console.print(f"[cyan]Size:[/cyan] {file_size:,} bytes")
         console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
 
-    zip_path = download_dir / filename
     if verbose:
         console.print(f"[cyan]Downloading template...[/cyan]")
 
+    # Small archives stay in memory; larger ones spill to a temporary file
+    archive = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
     try:
         with client.stream(
             "GET",
@@ -698,34 +979,30 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, scri
                     error_msg += f"\n\n[dim]Response body (truncated 400):[/dim]\n{response.text[:400]}"
                 raise RuntimeError(error_msg)
             total_size = int(response.headers.get('content-length', 0))
-            with open(zip_path, 'wb') as f:
-                if total_size == 0:
-                    for chunk in response.iter_bytes(chunk_size=8192):
-                        f.write(chunk)
-                else:
-                    if show_progress:
-                        with Progress(
-                            SpinnerColumn(),
-                            TextColumn("[progress.description]{task.description}"),
-                            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                            console=console,
-                        ) as progress:
-                            task = progress.add_task("Downloading...", total=total_size)
-                            downloaded = 0
-                            for chunk in response.iter_bytes(chunk_size=8192):
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                progress.update(task, completed=downloaded)
-                    else:
-                        for chunk in response.iter_bytes(chunk_size=8192):
-                            f.write(chunk)
+            chunks = response.iter_bytes(chunk_size=1024 * 1024)
+            if total_size and show_progress:
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                    console=console,
+                ) as progress:
+                    task = progress.add_task("Downloading...", total=total_size)
+                    downloaded = 0
+                    for chunk in chunks:
+                        archive.write(chunk)
+                        downloaded += len(chunk)
+                        progress.update(task, completed=downloaded)
+            else:
+                for chunk in chunks:
+                    archive.write(chunk)
     except Exception as e:
         console.print(f"[red]Error downloading template[/red]")
         detail = str(e)
-        if zip_path.exists():
-            zip_path.unlink()
+        archive.close()
         console.print(Panel(detail, title="Download Error", border_style="red"))
         raise typer.Exit(1)
+    archive.seek(0)
     if verbose:
         console.print(f"Downloaded: {filename}")
     metadata = {
@@ -734,26 +1011,59 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, scri
         "release": release_data["tag_name"],
         "asset_url": download_url
     }
-    return zip_path, metadata
+    return archive, metadata
+
+def extract_archive(zip_ref: zipfile.ZipFile, dest: Path) -> None:
+    """Extract every member of `zip_ref` into `dest` using a thread pool.
+
+    Inflating and writing release the GIL, so members are extracted in parallel.
+    `ZipFile` serialises reads of the underlying file internally.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def extract(member: zipfile.ZipInfo) -> None:
+        try:
+            zip_ref.extract(member, dest)
+        except FileExistsError:
+            # Another worker created the same parent directory between
+            # zipfile's existence check and its makedirs call; it exists now.
+            zip_ref.extract(member, dest)
+
+    members = zip_ref.infolist()
+    with ThreadPoolExecutor(max_workers=min(len(members), os.cpu_count() or 1) or 1) as pool:
+        # list() drains the iterator so worker exceptions propagate here
+        list(pool.map(extract, members))
+
+def _link_or_copy(src, dst):
+    """Hard-link `src` to `dst`, falling back to `shutil.copy2`.
+
+    Extracted template files are throwaway, so linking them into the project
+    avoids copying their bytes. Linking fails across filesystems, where hard
+    links are unsupported, or when `dst` already exists; those cases copy.
+    Usable as a `shutil.copytree` copy_function.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
 
-def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: httpx.Client = None, debug: bool = False, github_token: str = None) -> Path:
+def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: "httpx.Client | None" = None, debug: bool = False, github_token: str = None, release: "Future[dict] | None" = None) -> Path:
     """Download the latest release and extract it to create a new project.
     Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
     """
-    current_dir = Path.cwd()
-
     if tracker:
         tracker.start("fetch", "contacting GitHub API")
     try:
-        zip_path, meta = download_template_from_github(
+        archive, meta = download_template_from_github(
             ai_assistant,
-            current_dir,
             script_type=script_type,
             verbose=verbose and tracker is None,
             show_progress=(tracker is None),
             client=client,
             debug=debug,
-            github_token=github_token
+            github_token=github_token,
+            release=release,
         )
         if tracker:
             tracker.complete("fetch", f"release {meta['release']} ({meta['size']:,} bytes)")
@@ -777,7 +1087,7 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
         if not is_current_dir:
             project_path.mkdir(parents=True)
 
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        with zipfile.ZipFile(archive, 'r') as zip_ref:
             zip_contents = zip_ref.namelist()
             if tracker:
                 tracker.start("zip-list")
@@ -788,7 +1098,7 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
             if is_current_dir:
                 with tempfile.TemporaryDirectory() as temp_dir:
                     temp_path = Path(temp_dir)
-                    zip_ref.extractall(temp_path)
+                    extract_archive(zip_ref, temp_path)
 
                     extracted_items = list(temp_path.iterdir())
                     if tracker:
@@ -821,17 +1131,17 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
                                         if dest_file.name == "settings.json" and dest_file.parent.name == ".vscode":
                                             handle_vscode_settings(sub_item, dest_file, rel_path, verbose, tracker)
                                         else:
-                                            shutil.copy2(sub_item, dest_file)
+                                            _link_or_copy(sub_item, dest_file)
                             else:
-                                shutil.copytree(item, dest_path)
+                                shutil.copytree(item, dest_path, copy_function=_link_or_copy)
                         else:
                             if dest_path.exists() and verbose and not tracker:
                                 console.print(f"[yellow]Overwriting file:[/yellow] {item.name}")
-                            shutil.copy2(item, dest_path)
+                            _link_or_copy(item, dest_path)
                     if verbose and not tracker:
                         console.print(f"[cyan]Template files merged into current directory[/cyan]")
             else:
-                zip_ref.extractall(project_path)
+                extract_archive(zip_ref, project_path)
 
                 extracted_items = list(project_path.iterdir())
                 if tracker:
@@ -876,12 +1186,11 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
         if tracker:
             tracker.add("cleanup", "Remove temporary archive")
 
-        if zip_path.exists():
-            zip_path.unlink()
-            if tracker:
-                tracker.complete("cleanup")
-            elif verbose:
-                console.print(f"Cleaned up: {zip_path.name}")
+        archive.close()
+        if tracker:
+            tracker.complete("cleanup")
+        elif verbose:
+            console.print(f"Cleaned up: {meta['filename']}")
 
     return project_path
 
@@ -967,6 +1276,7 @@ def init(
         specify init --here
         specify init --here --force  # Skip confirmation when current directory not empty
     """
+    from rich.live import Live
 
     show_banner()
 
@@ -1031,42 +1341,35 @@ def init(
         if not should_init_git:
             console.print("[yellow]Git not found - will skip repository initialization[/yellow]")
 
+    # Reject bad flags before touching the network
+    if ai_assistant and ai_assistant not in AGENT_KEYS:
+        console.print(f"[red]Error:[/red] Invalid AI assistant '{ai_assistant}'. Choose from: {', '.join(AGENT_CONFIG.keys())}")
+        raise typer.Exit(1)
+    if script_type and script_type not in SCRIPT_TYPE_CHOICES:
+        console.print(f"[red]Error:[/red] Invalid script type '{script_type}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}")
+        raise typer.Exit(1)
+    if ai_assistant and not ignore_agent_tools:
+        _require_agent_cli(ai_assistant)
+
+    # Look up the latest release in the background while the user answers the
+    # prompts below; the download step waits on the result.
+    local_client = _new_client(False) if skip_tls else get_client()
+    release_future = _prefetch_release(local_client, debug=debug, github_token=github_token)
+
     if ai_assistant:
-        if ai_assistant not in AGENT_CONFIG:
-            console.print(f"[red]Error:[/red] Invalid AI assistant '{ai_assistant}'. Choose from: {', '.join(AGENT_CONFIG.keys())}")
-            raise typer.Exit(1)
         selected_ai = ai_assistant
     else:
         # Create options dict for selection (agent_key: display_name)
-        ai_choices = {key: config["name"] for key, config in AGENT_CONFIG.items()}
+        ai_choices = {key: config.name for key, config in AGENT_CONFIG.items()}
         selected_ai = select_with_arrows(
             ai_choices, 
             "Choose your AI assistant:", 
             "copilot"
         )
-
-    if not ignore_agent_tools:
-        agent_config = AGENT_CONFIG.get(selected_ai)
-        if agent_config and agent_config["requires_cli"]:
-            install_url = agent_config["install_url"]
-            if not check_tool(selected_ai):
-                error_panel = Panel(
-                    f"[cyan]{selected_ai}[/cyan] not found\n"
-                    f"Install from: [cyan]{install_url}[/cyan]\n"
-                    f"{agent_config['name']} is required to continue with this project type.\n\n"
-                    "Tip: Use [cyan]--ignore-agent-tools[/cyan] to skip this check",
-                    title="[red]Agent Detection Error[/red]",
-                    border_style="red",
-                    padding=(1, 2)
-                )
-                console.print()
-                console.print(error_panel)
-                raise typer.Exit(1)
+        if not ignore_agent_tools:
+            _require_agent_cli(selected_ai)
 
     if script_type:
-        if script_type not in SCRIPT_TYPE_CHOICES:
-            console.print(f"[red]Error:[/red] Invalid script type '{script_type}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}")
-            raise typer.Exit(1)
         selected_script = script_type
     else:
         default_script = "ps" if os.name == "nt" else "sh"
@@ -1108,11 +1411,7 @@ def init(
     with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
         tracker.attach_refresh(lambda: live.update(tracker.render()))
         try:
-            verify = not skip_tls
-            local_ssl_context = ssl_context if verify else False
-            local_client = httpx.Client(verify=local_ssl_context)
-
-            download_and_extract_template(project_path, selected_ai, selected_script, here, verbose=False, tracker=tracker, client=local_client, debug=debug, github_token=github_token)
+            download_and_extract_template(project_path, selected_ai, selected_script, here, verbose=False, tracker=tracker, client=local_client, debug=debug, github_token=github_token, release=release_future)
 
             ensure_executable_scripts(project_path, tracker=tracker)
 
@@ -1174,7 +1473,7 @@ def init(
     # Agent folder security notice
     agent_config = AGENT_CONFIG.get(selected_ai)
     if agent_config:
-        agent_folder = agent_config["folder"]
+        agent_folder = agent_config.folder
         security_notice = Panel(
             f"Some agents may store credentials, auth tokens, or other identifying and private artifacts in the agent folder within your project.\n"
             f"Consider adding [cyan]{agent_folder}[/cyan] (or parts of it) to [cyan].gitignore[/cyan] to prevent accidental credential leakage.",
@@ -1236,18 +1535,20 @@ def check():
 
     tracker = StepTracker("Check Available Tools")
 
+    available = check_tools(["git", *CLI_AGENT_KEYS, "code", "code-insiders"])
+
     tracker.add("git", "Git version control")
-    git_ok = check_tool("git", tracker=tracker)
+    git_ok = check_tool("git", tracker=tracker, found=available["git"])
 
     agent_results = {}
     for agent_key, agent_config in AGENT_CONFIG.items():
-        agent_name = agent_config["name"]
-        requires_cli = agent_config["requires_cli"]
+        agent_name = agent_config.name
+        requires_cli = agent_config.requires_cli
 
         tracker.add(agent_key, agent_name)
 
         if requires_cli:
-            agent_results[agent_key] = check_tool(agent_key, tracker=tracker)
+            agent_results[agent_key] = check_tool(agent_key, tracker=tracker, found=available[agent_key])
         else:
             # IDE-based agent - skip CLI check and mark as optional
             tracker.skip(agent_key, "IDE-based, no CLI check")
@@ -1255,10 +1556,10 @@ def check():
 
     # Check VS Code variants (not in agent config)
     tracker.add("code", "Visual Studio Code")
-    code_ok = check_tool("code", tracker=tracker)
+    code_ok = check_tool("code", tracker=tracker, found=available["code"])
 
     tracker.add("code-insiders", "Visual Studio Code Insiders")
-    code_insiders_ok = check_tool("code-insiders", tracker=tracker)
+    code_insiders_ok = check_tool("code-insiders", tracker=tracker, found=available["code-insiders"])
 
     console.print(tracker.render())
 
@@ -1275,6 +1576,7 @@ def version():
     """Display version and system information."""
     import platform
     import importlib.metadata
+    from rich.table import Table
     
     show_banner()
     
@@ -1303,14 +1605,9 @@ def version():
     release_date = "unknown"
     
     try:
-        response = client.get(
-            api_url,
-            timeout=10,
-            follow_redirects=True,
-            headers=_github_auth_headers(),
-        )
+        response = _cached_get(get_client(), api_url, timeout=10, headers=_github_api_headers())
         if response.status_code == 200:
-            release_data = response.json()
+            release_data = orjson.loads(response.content)
             template_version = release_data.get("tag_name", "unknown")
             # Remove 'v' prefix if present
             if template_version.startswith("v"):